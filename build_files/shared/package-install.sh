@@ -152,13 +152,15 @@ install_packages() {
 				rm -rf /opt/google
 			fi
 		fi
+		# keepcache leaves downloaded RPMs in the cache mount (see Containerfile)
+		# so unchanged packages are not downloaded again on the next build
 		if command -v dnf5 &>/dev/null; then
-			dnf5 install -y "${packages_to_install[@]}" || {
+			dnf5 install -y --setopt=keepcache=True "${packages_to_install[@]}" || {
 				log "ERROR" "Failed to install packages"
 				exit 1
 			}
 		else
-			dnf install -y "${packages_to_install[@]}" || {
+			dnf install -y --setopt=keepcache=True "${packages_to_install[@]}" || {
 				log "ERROR" "Failed to install packages"
 				exit 1
 			}
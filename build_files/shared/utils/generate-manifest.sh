@@ -16,12 +16,8 @@ set -euo pipefail
 
 # Get script directory and project root
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-# If we're in a bind mount context (/ctx), use /ctx as root, otherwise calculate from script dir
-if [[ "$SCRIPT_DIR" == /tmp/* ]]; then
-	PROJECT_ROOT="/ctx"
-else
-	PROJECT_ROOT="$(cd "$SCRIPT_DIR/../../.." && pwd)"
-fi
+# Resolves to /ctx when run from the build context bind mount during the build
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/../../.." && pwd)"
 
 # Source required utilities
 # shellcheck disable=SC1091
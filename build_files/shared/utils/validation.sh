@@ -74,29 +74,29 @@ validate_module_header() {
 	header=$(head -n 20 "$script")
 
 	# Check required fields
-	if ! echo "$header" | grep -q "^# Purpose:"; then
+	if ! grep -q "^# Purpose:" <<<"$header"; then
 		log "ERROR" "Missing Purpose field in $script"
 		errors=$((errors + 1))
 	fi
 
-	if ! echo "$header" | grep -q "^# Category:"; then
+	if ! grep -q "^# Category:" <<<"$header"; then
 		log "ERROR" "Missing Category field in $script"
 		errors=$((errors + 1))
 	fi
 
-	if ! echo "$header" | grep -q "^# Dependencies:"; then
+	if ! grep -q "^# Dependencies:" <<<"$header"; then
 		log "ERROR" "Missing Dependencies field in $script"
 		errors=$((errors + 1))
 	fi
 
-	if ! echo "$header" | grep -q "^# Parallel-Safe:"; then
+	if ! grep -q "^# Parallel-Safe:" <<<"$header"; then
 		log "ERROR" "Missing Parallel-Safe field in $script"
 		errors=$((errors + 1))
 	fi
 
 	# Check Parallel-Safe value
-	if echo "$header" | grep -q "^# Parallel-Safe:"; then
-		parallel_safe=$(echo "$header" | grep "^# Parallel-Safe:" | cut -d: -f2 | xargs)
+	if grep -q "^# Parallel-Safe:" <<<"$header"; then
+		parallel_safe=$(grep "^# Parallel-Safe:" <<<"$header" | cut -d: -f2 | xargs)
 		if [[ "$parallel_safe" != "yes" ]] && [[ "$parallel_safe" != "no" ]]; then
 			log "ERROR" "Parallel-Safe must be 'yes' or 'no' in $script (found: $parallel_safe)"
 			errors=$((errors + 1))
@@ -104,19 +104,19 @@ validate_module_header() {
 	fi
 
 	# Check for shebang
-	if ! head -n 1 "$script" | grep -q "^#!/"; then
+	if ! grep -q "^#!/" < <(head -n 1 "$script"); then
 		log "ERROR" "Missing shebang in $script"
 		errors=$((errors + 1))
 	fi
 
 	# Check for set -eoux pipefail or set -euo pipefail
-	if ! head -n 15 "$script" | grep -q "set -e.*o.*pipefail"; then
+	if ! grep -q "set -e.*o.*pipefail" < <(head -n 15 "$script"); then
 		log "WARNING" "Missing 'set -eoux pipefail' or 'set -euo pipefail' in $script"
 		warnings=$((warnings + 1))
 	fi
 
 	# Check Author field (warning only)
-	if ! echo "$header" | grep -q "^# Author:"; then
+	if ! grep -q "^# Author:" <<<"$header"; then
 		log "WARNING" "Missing Author field in $script"
 		warnings=$((warnings + 1))
 	fi
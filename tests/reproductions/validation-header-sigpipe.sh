@@ -0,0 +1,39 @@
+#!/usr/bin/env bash
+# Purpose: Minimal reproduction for intermittent module header validation failures
+# Bug: validate_module_header sometimes reports a header field as missing although it is present
+# Usage: Run from repository root: bash tests/reproductions/validation-header-sigpipe.sh [iterations]
+# Expectation: A module with a complete header validates without critical errors on every run
+# Actual: `echo "$header" | grep -q ...` can return 141 under pipefail. grep -q matches and
+#         exits, then echo is killed by SIGPIPE (PIPESTATUS "141 0"), so the check reports "missing"
+set -euo pipefail
+
+PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+ITERATIONS="${1:-1000}"
+MODULE="build_files/shared/flatpaks.sh"
+
+cd "$PROJECT_ROOT"
+# shellcheck source=build_files/shared/utils/validation.sh
+source build_files/shared/utils/validation.sh
+
+false_errors=0
+for _ in $(seq 1 "$ITERATIONS"); do
+	exit_code=0
+	validate_module_header "$MODULE" >/dev/null 2>&1 || exit_code=$?
+	if [[ $exit_code -eq 1 ]]; then
+		false_errors=$((false_errors + 1))
+	fi
+done
+
+if [[ $false_errors -gt 0 ]]; then
+	cat <<EOF
+Bug reproduced for ${MODULE}:
+  Expected critical errors = 0
+  Actual critical errors   = ${false_errors} of ${ITERATIONS} runs
+EOF
+	exit 1
+fi
+
+cat <<EOF
+Reproduction complete: ${MODULE} validated cleanly in all ${ITERATIONS} runs.
+If this message prints, the bug is no longer present.
+EOF
@@ -95,7 +95,7 @@ run_manifest_image_check() {
 
 	echo -n "Checking build manifest image ref... "
 
-	if ! manifest_image=$(podman run --rm "${IMAGE_NAME}" jq -r '.build.image // "unknown"' /etc/dudley/build-manifest.json 2>&1); then
+	if ! manifest_image=$(podman exec "${CONTAINER_ID}" jq -r '.build.image // "unknown"' /etc/dudley/build-manifest.json 2>&1); then
 		echo -e "${RED}✗${NC} (command failed)"
 		FAILED_CHECKS=$((FAILED_CHECKS + 1))
 		return 1
@@ -119,10 +119,18 @@ run_manifest_image_check() {
 echo "=== Image Existence ==="
 run_check "image exists" "podman images -q ${IMAGE_NAME}" ""
 
+# Start a single container and run every check inside it with podman exec,
+# instead of creating (and tearing down) a new container per check
+if ! CONTAINER_ID=$(podman run -d --rm --entrypoint sleep "${IMAGE_NAME}" infinity 2>&1); then
+	echo -e "${RED}✗${NC} Failed to start a container from ${IMAGE_NAME}: ${CONTAINER_ID}"
+	exit 1
+fi
+trap 'podman rm -f -t 0 "${CONTAINER_ID}" >/dev/null 2>&1 || true' EXIT
+
 # Check 2: Base OS
 echo ""
 echo "=== Base Operating System ==="
-if OS_RELEASE_CONTENT="$(podman run --rm "${IMAGE_NAME}" cat /etc/os-release 2>&1)"; then
+if OS_RELEASE_CONTENT="$(podman exec "${CONTAINER_ID}" cat /etc/os-release 2>&1)"; then
 	run_os_release_check "base OS" "ID" "${EXPECTED_OS_ID}"
 
 	if [[ -n "${EXPECTED_VERSION_ID}" ]]; then
@@ -140,54 +148,54 @@ fi
 # Check 3: Packages from packages.json
 echo ""
 echo "=== Installed Packages ==="
-run_check "tmux" "podman run --rm ${IMAGE_NAME} rpm -q tmux" "tmux-"
-run_check "curl" "podman run --rm ${IMAGE_NAME} rpm -q curl" "curl-"
-run_check "gcc-c++" "podman run --rm ${IMAGE_NAME} rpm -q gcc-c++" "gcc-c++-"
-run_check "Google Chrome" "podman run --rm ${IMAGE_NAME} rpm -q google-chrome-stable" "google-chrome-stable-"
+run_check "tmux" "podman exec ${CONTAINER_ID} rpm -q tmux" "tmux-"
+run_check "curl" "podman exec ${CONTAINER_ID} rpm -q curl" "curl-"
+run_check "gcc-c++" "podman exec ${CONTAINER_ID} rpm -q gcc-c++" "gcc-c++-"
+run_check "Google Chrome" "podman exec ${CONTAINER_ID} rpm -q google-chrome-stable" "google-chrome-stable-"
 
 # Check 5: Custom Branding
 echo ""
 echo "=== Custom Branding ==="
-run_check "wallpaper directory" "podman run --rm ${IMAGE_NAME} test -d /usr/share/backgrounds/dudley && echo exists" "exists"
-run_check "wallpaper files" "podman run --rm ${IMAGE_NAME} find /usr/share/backgrounds/dudley -maxdepth 1 -type f \( -name '*.png' -o -name '*.jpg' -o -name '*.jpeg' \) | wc -l" "${EXPECTED_WALLPAPER_COUNT}"
-run_check "GNOME schema override" "podman run --rm ${IMAGE_NAME} test -f /usr/share/glib-2.0/schemas/zz0-dudley-background.gschema.override && echo exists" "exists"
+run_check "wallpaper directory" "podman exec ${CONTAINER_ID} test -d /usr/share/backgrounds/dudley && echo exists" "exists"
+run_check "wallpaper files" "podman exec ${CONTAINER_ID} find /usr/share/backgrounds/dudley -maxdepth 1 -type f \( -name '*.png' -o -name '*.jpg' -o -name '*.jpeg' \) | wc -l" "${EXPECTED_WALLPAPER_COUNT}"
+run_check "GNOME schema override" "podman exec ${CONTAINER_ID} test -f /usr/share/glib-2.0/schemas/zz0-dudley-background.gschema.override && echo exists" "exists"
 
 # Check 6: Flatpaks Configuration
 echo ""
 echo "=== Flatpaks Configuration ==="
-run_check "flatpaks directory" "podman run --rm ${IMAGE_NAME} test -d /usr/share/ublue-os/flatpaks && echo exists" "exists"
-run_check "system flatpaks list" "podman run --rm ${IMAGE_NAME} test -f /usr/share/ublue-os/flatpaks/system-flatpaks.list && echo exists" "exists"
-run_check "DX flatpaks list" "podman run --rm ${IMAGE_NAME} test -f /usr/share/ublue-os/flatpaks/system-flatpaks-dx.list && echo exists" "exists"
+run_check "flatpaks directory" "podman exec ${CONTAINER_ID} test -d /usr/share/ublue-os/flatpaks && echo exists" "exists"
+run_check "system flatpaks list" "podman exec ${CONTAINER_ID} test -f /usr/share/ublue-os/flatpaks/system-flatpaks.list && echo exists" "exists"
+run_check "DX flatpaks list" "podman exec ${CONTAINER_ID} test -f /usr/share/ublue-os/flatpaks/system-flatpaks-dx.list && echo exists" "exists"
 
 # Check 7: User Hooks
 echo ""
 echo "=== User Setup Hooks ==="
-run_check "wallpaper hook" "podman run --rm ${IMAGE_NAME} test -f /usr/share/ublue-os/user-setup.hooks.d/10-wallpaper-enforcement.sh && echo exists" "exists"
-run_check "usr/local symlink target" "podman run --rm ${IMAGE_NAME} sh -c 'test -L /usr/local && readlink /usr/local'" "var/usrlocal"
-run_check "random wallpaper script" "podman run --rm ${IMAGE_NAME} test -x /usr/bin/dudley-random-wallpaper && echo exists" "exists"
-run_check "random wallpaper autostart" "podman run --rm ${IMAGE_NAME} test -f /etc/xdg/autostart/dudley-random-wallpaper.desktop && echo exists" "exists"
+run_check "wallpaper hook" "podman exec ${CONTAINER_ID} test -f /usr/share/ublue-os/user-setup.hooks.d/10-wallpaper-enforcement.sh && echo exists" "exists"
+run_check "usr/local symlink target" "podman exec ${CONTAINER_ID} sh -c 'test -L /usr/local && readlink /usr/local'" "var/usrlocal"
+run_check "random wallpaper script" "podman exec ${CONTAINER_ID} test -x /usr/bin/dudley-random-wallpaper && echo exists" "exists"
+run_check "random wallpaper autostart" "podman exec ${CONTAINER_ID} test -f /etc/xdg/autostart/dudley-random-wallpaper.desktop && echo exists" "exists"
 
 # Check 7b: VS Code Runtime Configuration
 echo ""
 echo "=== VS Code Runtime Configuration ==="
-run_check "VS Code extensions list" "podman run --rm ${IMAGE_NAME} test -f /usr/share/ublue-os/vscode-extensions.list && echo exists" "exists"
-run_check "VS Code not baked into image" "podman run --rm ${IMAGE_NAME} bash -lc '! command -v code-insiders >/dev/null 2>&1 && echo absent'" "absent"
-run_check "Dudley just recipes" "podman run --rm ${IMAGE_NAME} test -f /usr/share/ublue-os/just/60-dudley.just && echo exists" "exists"
-run_check "Dudley update override" "podman run --rm ${IMAGE_NAME} bash -lc 'grep -F \"^[[:space:]]*LockLayering\" /usr/share/ublue-os/just/update.just >/dev/null && echo fixed'" "fixed"
-run_check "Dudley system flatpak update uses polkit" "podman run --rm ${IMAGE_NAME} bash -lc 'grep -F \"flatpak update -y\" /usr/share/ublue-os/just/update.just >/dev/null && ! grep -E \"sudo[[:space:]]+flatpak[[:space:]]+update\" /usr/share/ublue-os/just/update.just >/dev/null && echo fixed'" "fixed"
-run_check "Dudley terminal shortcut opens new Ptyxis window" "podman run --rm ${IMAGE_NAME} bash -lc 'grep -F \"command='\\''/usr/bin/ptyxis --new-window'\\''\" /etc/dconf/db/distro.d/99-dudley-terminal-keybindings | wc -l'" "2"
+run_check "VS Code extensions list" "podman exec ${CONTAINER_ID} test -f /usr/share/ublue-os/vscode-extensions.list && echo exists" "exists"
+run_check "VS Code not baked into image" "podman exec ${CONTAINER_ID} bash -lc '! command -v code-insiders >/dev/null 2>&1 && echo absent'" "absent"
+run_check "Dudley just recipes" "podman exec ${CONTAINER_ID} test -f /usr/share/ublue-os/just/60-dudley.just && echo exists" "exists"
+run_check "Dudley update override" "podman exec ${CONTAINER_ID} bash -lc 'grep -F \"^[[:space:]]*LockLayering\" /usr/share/ublue-os/just/update.just >/dev/null && echo fixed'" "fixed"
+run_check "Dudley system flatpak update uses polkit" "podman exec ${CONTAINER_ID} bash -lc 'grep -F \"flatpak update -y\" /usr/share/ublue-os/just/update.just >/dev/null && ! grep -E \"sudo[[:space:]]+flatpak[[:space:]]+update\" /usr/share/ublue-os/just/update.just >/dev/null && echo fixed'" "fixed"
+run_check "Dudley terminal shortcut opens new Ptyxis window" "podman exec ${CONTAINER_ID} bash -lc 'grep -F \"command='\\''/usr/bin/ptyxis --new-window'\\''\" /etc/dconf/db/distro.d/99-dudley-terminal-keybindings | wc -l'" "2"
 
 # Note: RCC is now installed via Homebrew (ujust dudley brew dev) instead of being baked into the image
 
 # Check 8: Image Metadata
 echo ""
 echo "=== Image Metadata ==="
-run_check "build manifest exists" "podman run --rm ${IMAGE_NAME} test -f /etc/dudley/build-manifest.json && echo exists" "exists"
+run_check "build manifest exists" "podman exec ${CONTAINER_ID} test -f /etc/dudley/build-manifest.json && echo exists" "exists"
 run_manifest_image_check
-run_check "image-info exists" "podman run --rm ${IMAGE_NAME} test -f /usr/share/ublue-os/image-info.json && echo exists" "exists"
-run_check "image-info flavor preserves base flavor" "podman run --rm ${IMAGE_NAME} jq -r '.\"image-flavor\"' /usr/share/ublue-os/image-info.json" "^$(escape_regex "${EXPECTED_IMAGE_FLAVOR}")$"
-run_check "image-info ref omits tag" "podman run --rm ${IMAGE_NAME} jq -r '.\"image-ref\"' /usr/share/ublue-os/image-info.json" "^ostree-image-signed:docker://[^:]*$"
-run_check "image-info tag" "podman run --rm ${IMAGE_NAME} cat /usr/share/ublue-os/image-info.json | jq -r '.\"image-tag\"'" "^$(escape_regex "${EXPECTED_IMAGE_TAG}")$"
+run_check "image-info exists" "podman exec ${CONTAINER_ID} test -f /usr/share/ublue-os/image-info.json && echo exists" "exists"
+run_check "image-info flavor preserves base flavor" "podman exec ${CONTAINER_ID} jq -r '.\"image-flavor\"' /usr/share/ublue-os/image-info.json" "^$(escape_regex "${EXPECTED_IMAGE_FLAVOR}")$"
+run_check "image-info ref omits tag" "podman exec ${CONTAINER_ID} jq -r '.\"image-ref\"' /usr/share/ublue-os/image-info.json" "^ostree-image-signed:docker://[^:]*$"
+run_check "image-info tag" "podman exec ${CONTAINER_ID} cat /usr/share/ublue-os/image-info.json | jq -r '.\"image-tag\"'" "^$(escape_regex "${EXPECTED_IMAGE_TAG}")$"
 
 IMAGE_SIZE=$(podman inspect "${IMAGE_NAME}" | jq -r '.[0].Size')
 IMAGE_SIZE_GB=$(awk "BEGIN {printf \"%.1f\", ${IMAGE_SIZE} / 1024 / 1024 / 1024}")